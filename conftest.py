@@ -0,0 +1,13 @@
+"""
+Shared pytest harness for the HTTP smoke-test scripts (test_routes.py, test_post_endpoints.py)
+"""
+
+import pytest
+
+from smoke_session import make_session
+
+@pytest.fixture(scope="session")
+async def session():
+    """One session shared by every async smoke test, configured like the scripts' main()"""
+    async with make_session() as client:
+        yield client
@@ -1,5 +1,6 @@
 import subprocess
 import os
+import socket
 import time
 
 # Start the mock server in the background
@@ -8,11 +9,20 @@ mock_server_process = subprocess.Popen(
     env={**os.environ, "PORT": "8001"}
 )
 
-# Wait for the server to start
-time.sleep(3)
+# Wait for the server to accept connections (up to ~3s)
+for _ in range(60):
+    try:
+        socket.create_connection(("127.0.0.1", 8001), 0.1).close()
+        break
+    except OSError:
+        time.sleep(0.05)
 
 # Run the flow script
 flow_script_process = subprocess.run(["node", "scripts/run_real_flow.js"])
 
-# Kill the mock server
-mock_server_process.kill()
+# Stop the mock server
+mock_server_process.terminate()
+try:
+    mock_server_process.wait(timeout=5)
+except subprocess.TimeoutExpired:
+    mock_server_process.kill()
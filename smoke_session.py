@@ -0,0 +1,13 @@
+"""
+Shared aiohttp session settings for the smoke-test scripts (test_routes.py, test_post_endpoints.py)
+"""
+
+import aiohttp
+
+def make_session() -> aiohttp.ClientSession:
+    """Keep-alive session sized for the handful of concurrent calls made to one host"""
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=10, limit_per_host=10, keepalive_timeout=30),
+        timeout=aiohttp.ClientTimeout(total=10),
+        headers={"Connection": "keep-alive"},
+    )
@@ -4,22 +4,46 @@ Comprehensive Integration Test for Adaptive Tags with BHIV Core
 """
 
 import asyncio
-import json
+import collections
+import contextlib
+import gzip
+import sys
 import time
 import aiohttp
+import orjson
 from typing import Dict, Any, List
 
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
+
+# Per-request limits so one hung service cannot stall the whole run
+TIMEOUT = aiohttp.ClientTimeout(total=5, connect=2, sock_read=3)
+
 class AdaptiveTagsIntegrationTester:
     def __init__(self):
         self.bhiv_base_url = "http://localhost:8001"
         self.adaptive_tags_base_url = "http://localhost:8000"
+        self.urls = {
+            "bhiv_health": f"{self.bhiv_base_url}/health",
+            "bhiv_root": f"{self.bhiv_base_url}/",
+            "adaptive_health": f"{self.adaptive_tags_base_url}/health",
+            "adaptive_healthz": f"{self.adaptive_tags_base_url}/healthz",
+            "thresholds": f"{self.adaptive_tags_base_url}/thresholds",
+        }
         self.test_results = {
             "timestamp": time.time(),
             "tests_run": 0,
             "tests_passed": 0,
-            "tests_failed": 0,
-            "test_details": []
+            "tests_failed": 0
         }
+        # Per-test records stream to a JSONL file; only the counters stay in memory
+        self.results_path = f"integration_test_results_{int(time.time())}.jsonl.gz"
+        self._results_fp = None
+        # Log lines are queued and written to stdout in batches by _drain_logs
+        self._log_queue = collections.deque()
+        self._log_ready = None
 
     def log_test(self, test_name: str, status: str, details: str = "", response_data: Dict = None):
         """Log test results"""
@@ -27,10 +51,12 @@ class AdaptiveTagsIntegrationTester:
             "test_name": test_name,
             "status": status,
             "details": details,
-            "response_data": response_data,
+            # Only failures need the response body for debugging
+            "response_data": response_data if status != "PASS" else None,
             "timestamp": time.time()
         }
-        self.test_results["test_details"].append(test_result)
+        if self._results_fp is not None:
+            self._results_fp.write(orjson.dumps(test_result) + b"\n")
         self.test_results["tests_run"] += 1
         
         if status == "PASS":
@@ -38,18 +64,48 @@ class AdaptiveTagsIntegrationTester:
         else:
             self.test_results["tests_failed"] += 1
             
-        print(f"[{status}] {test_name}: {details}")
+        self._log_queue.append(f"[{status}] {test_name}: {details}\n")
+        if self._log_ready is not None:
+            self._log_ready.set()
+
+    def _flush_logs(self, batch_size: int = 16):
+        """Write queued log lines to stdout, one flush per batch"""
+        while self._log_queue:
+            batch = [self._log_queue.popleft() for _ in range(min(batch_size, len(self._log_queue)))]
+            sys.stdout.write("".join(batch))
+            sys.stdout.flush()
+
+    async def _drain_logs(self):
+        """Background task that flushes queued log lines as they arrive"""
+        while True:
+            await self._log_ready.wait()
+            self._log_ready.clear()
+            self._flush_logs()
+
+    async def _error_body(self, response: aiohttp.ClientResponse):
+        """Decode a failed response body for diagnostics"""
+        try:
+            return await response.json(loads=orjson.loads, content_type=None)
+        except ValueError:
+            return {"body": await response.text()}
+
+    async def _warm_up(self, session: aiohttp.ClientSession, url: str):
+        """Prime a pooled keep-alive connection so the real probe skips setup"""
+        async with session.get(url) as response:
+            await response.read()
 
     async def test_bhiv_core_health(self, session: aiohttp.ClientSession):
         """Test BHIV Core service health"""
         try:
-            async with session.get(f"{self.bhiv_base_url}/health") as response:
+            async with session.get(self.urls["bhiv_health"]) as response:
                 if response.status == 200:
-                    data = await response.json()
-                    self.log_test("BHIV Core Health", "PASS", "Service is healthy", data)
+                    # Drain the body so the connection can be reused; no need to parse it
+                    await response.read()
+                    self.log_test("BHIV Core Health", "PASS", "Service is healthy")
                     return True
                 else:
-                    self.log_test("BHIV Core Health", "FAIL", f"Status: {response.status}")
+                    self.log_test("BHIV Core Health", "FAIL", f"Status: {response.status}",
+                                  await self._error_body(response))
                     return False
         except Exception as e:
             self.log_test("BHIV Core Health", "FAIL", f"Connection error: {str(e)}")
@@ -58,13 +114,15 @@ class AdaptiveTagsIntegrationTester:
     async def test_adaptive_tags_health(self, session: aiohttp.ClientSession):
         """Test Adaptive Tags service health"""
         try:
-            async with session.get(f"{self.adaptive_tags_base_url}/health") as response:
+            async with session.get(self.urls["adaptive_health"]) as response:
                 if response.status == 200:
-                    data = await response.json()
-                    self.log_test("Adaptive Tags Health", "PASS", "Service is healthy", data)
+                    # Drain the body so the connection can be reused; no need to parse it
+                    await response.read()
+                    self.log_test("Adaptive Tags Health", "PASS", "Service is healthy")
                     return True
                 else:
-                    self.log_test("Adaptive Tags Health", "FAIL", f"Status: {response.status}")
+                    self.log_test("Adaptive Tags Health", "FAIL", f"Status: {response.status}",
+                                  await self._error_body(response))
                     return False
         except Exception as e:
             self.log_test("Adaptive Tags Health", "FAIL", f"Connection error: {str(e)}")
@@ -75,13 +133,14 @@ class AdaptiveTagsIntegrationTester:
         try:
             # Add API key header
             headers = {'X-API-Key': 'ADAPTIVE123'}
-            async with session.get(f"{self.adaptive_tags_base_url}/thresholds", headers=headers) as response:
+            async with session.get(self.urls["thresholds"], headers=headers) as response:
                 if response.status == 200:
-                    data = await response.json()
-                    self.log_test("Adaptive Tags Thresholds", "PASS", "Thresholds retrieved", data)
+                    await response.read()
+                    self.log_test("Adaptive Tags Thresholds", "PASS", "Thresholds retrieved")
                     return True
                 else:
-                    self.log_test("Adaptive Tags Thresholds", "FAIL", f"Status: {response.status}")
+                    self.log_test("Adaptive Tags Thresholds", "FAIL", f"Status: {response.status}",
+                                  await self._error_body(response))
                     return False
         except Exception as e:
             self.log_test("Adaptive Tags Thresholds", "FAIL", f"Error: {str(e)}")
@@ -91,73 +150,117 @@ class AdaptiveTagsIntegrationTester:
         """Test BHIV Core main endpoints"""
         try:
             # Test main API endpoint
-            async with session.get(f"{self.bhiv_base_url}/") as response:
+            async with session.get(self.urls["bhiv_root"]) as response:
                 if response.status == 200:
-                    data = await response.json()
-                    self.log_test("BHIV Core API", "PASS", "API endpoint working", data)
+                    await response.read()
+                    self.log_test("BHIV Core API", "PASS", "API endpoint working")
                     return True
                 else:
-                    self.log_test("BHIV Core API", "FAIL", f"Status: {response.status}")
+                    self.log_test("BHIV Core API", "FAIL", f"Status: {response.status}",
+                                  await self._error_body(response))
                     return False
         except Exception as e:
             self.log_test("BHIV Core API", "FAIL", f"Error: {str(e)}")
             return False
 
+    async def _get_json(self, session: aiohttp.ClientSession, url: str):
+        """GET url and return (status, parsed body or None when the status is not 200)"""
+        async with session.get(url) as response:
+            if response.status != 200:
+                return response.status, None
+            return response.status, await response.json(loads=orjson.loads)
+
     async def test_integration_flow(self, session: aiohttp.ClientSession):
         """Test integration flow between services"""
         try:
-            # First get adaptive tags health
-            async with session.get(f"{self.adaptive_tags_base_url}/healthz") as adaptive_response:
-                if adaptive_response.status != 200:
-                    self.log_test("Integration Flow", "FAIL", "Adaptive tags health failed")
-                    return False
-                
-                adaptive_data = await adaptive_response.json()
+            # Fetch adaptive tags and BHIV Core health concurrently
+            (adaptive_status, adaptive_data), (bhiv_status, bhiv_data) = await asyncio.gather(
+                self._get_json(session, self.urls["adaptive_healthz"]),
+                self._get_json(session, self.urls["bhiv_health"]),
+            )
+            if adaptive_status != 200:
+                self.log_test("Integration Flow", "FAIL", "Adaptive tags health failed")
+                return False
+            if bhiv_status != 200:
+                self.log_test("Integration Flow", "FAIL", "BHIV Core health failed")
+                return False
+            
+            # Check if both services are healthy
+            if adaptive_data.get("status") == "ok" and bhiv_data.get("status") == "healthy":
+                self.log_test("Integration Flow", "PASS", "Both services healthy", {
+                    "adaptive_tags": adaptive_data,
+                    "bhiv_core": bhiv_data
+                })
+                return True
+            else:
+                self.log_test("Integration Flow", "FAIL", "Services not fully healthy", {
+                    "adaptive_tags": adaptive_data,
+                    "bhiv_core": bhiv_data
+                })
+                return False
                 
-                # Then get BHIV Core health
-                async with session.get(f"{self.bhiv_base_url}/health") as bhiv_response:
-                    if bhiv_response.status != 200:
-                        self.log_test("Integration Flow", "FAIL", "BHIV Core health failed")
-                        return False
-                    
-                    bhiv_data = await bhiv_response.json()
-                    
-                    # Check if both services are healthy
-                    if adaptive_data.get("status") == "ok" and bhiv_data.get("status") == "healthy":
-                        self.log_test("Integration Flow", "PASS", "Both services healthy", {
-                            "adaptive_tags": adaptive_data,
-                            "bhiv_core": bhiv_data
-                        })
-                        return True
-                    else:
-                        self.log_test("Integration Flow", "FAIL", "Services not fully healthy", {
-                            "adaptive_tags": adaptive_data,
-                            "bhiv_core": bhiv_data
-                        })
-                        return False
-                        
         except Exception as e:
             self.log_test("Integration Flow", "FAIL", f"Error: {str(e)}")
             return False
 
+    async def _run_probes(self):
+        """Run every probe on one pooled session, draining logs in the background"""
+        # One pooled keep-alive session for every test against both hosts
+        connector = aiohttp.TCPConnector(
+            limit=64,
+            limit_per_host=16,
+            keepalive_timeout=60,
+            enable_cleanup_closed=True,
+        )
+        session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=TIMEOUT,
+        )
+        self._log_ready = asyncio.Event()
+        drain_task = asyncio.create_task(self._drain_logs())
+        try:
+            # Warm up one connection per host; failures surface in the real tests
+            await asyncio.gather(
+                self._warm_up(session, self.urls["bhiv_health"]),
+                self._warm_up(session, self.urls["adaptive_health"]),
+                return_exceptions=True,
+            )
+            
+            # The probes are independent, so run them concurrently
+            await asyncio.gather(
+                # Test service health
+                self.test_bhiv_core_health(session),
+                self.test_adaptive_tags_health(session),
+                # Test BHIV Core endpoints
+                self.test_bhiv_core_endpoints(session),
+                # Test Adaptive Tags endpoints
+                self.test_adaptive_tags_thresholds(session),
+                # Test integration
+                self.test_integration_flow(session),
+                return_exceptions=True,
+            )
+        finally:
+            await session.close()
+            drain_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await drain_task
+            self._log_ready = None
+            self._flush_logs()
+
     async def run_comprehensive_tests(self):
         """Run all integration tests"""
         print("Starting Comprehensive Integration Tests...")
         print("=" * 50)
         
-        async with aiohttp.ClientSession() as session:
-            # Test service health
-            await self.test_bhiv_core_health(session)
-            await self.test_adaptive_tags_health(session)
-            
-            # Test BHIV Core endpoints
-            await self.test_bhiv_core_endpoints(session)
-            
-            # Test Adaptive Tags endpoints
-            await self.test_adaptive_tags_thresholds(session)
-            
-            # Test integration
-            await self.test_integration_flow(session)
+        # Append-only, level-1 gzipped JSONL sink: one line per test, then a summary.
+        # The summary and gzip trailer are written even if the run is interrupted.
+        with gzip.open(self.results_path, "ab", compresslevel=1) as results_fp:
+            self._results_fp = results_fp
+            try:
+                await self._run_probes()
+            finally:
+                results_fp.write(orjson.dumps({"summary": self.test_results}) + b"\n")
+                self._results_fp = None
             
         # Print summary
         print("\n" + "=" * 50)
@@ -168,9 +271,7 @@ class AdaptiveTagsIntegrationTester:
         print(f"Failed: {self.test_results['tests_failed']}")
         print(f"Success Rate: {(self.test_results['tests_passed'] / self.test_results['tests_run'] * 100):.1f}%")
         
-        # Save results to file
-        with open(f"integration_test_results_{int(time.time())}.json", "w") as f:
-            json.dump(self.test_results, f, indent=2)
+        sys.stdout.flush()
         
         return self.test_results
 
@@ -180,4 +281,9 @@ async def main():
     await tester.run_comprehensive_tests()
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    if uvloop is not None and hasattr(uvloop, "run"):
+        uvloop.run(main())
+    else:
+        if uvloop is not None:  # uvloop < 0.18 has no uvloop.run
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        asyncio.run(main())
\ No newline at end of file
@@ -3,129 +3,145 @@
 Test script for verifying all required routes are working
 """
 
-import requests
+import asyncio
+import aiohttp
 import json
 
+from smoke_session import make_session
+
 BASE_URL = "http://localhost:8001"
 
-def test_moderate_endpoint():
-    """Test /moderate endpoint"""
-    print("Testing /moderate endpoint...")
+# Request bodies are constant, so serialize them once at import
+JSON_HEADERS = {"Content-Type": "application/json"}
+FEEDBACK_PAYLOAD = json.dumps({
+    "userId": "test_user",
+    "thumbsUp": True,
+    "comment": "Great content moderation system"
+}).encode("utf-8")
+QUERY_KB_NLP_PAYLOAD = json.dumps({
+    "query": "Analyze content with ID 123 for NLP context",
+    "limit": 3,
+    "user_id": "frontend_user"
+}).encode("utf-8")
+QUERY_KB_TAGS_PAYLOAD = json.dumps({
+    "query": "Generate tags for content with ID 456",
+    "limit": 2,
+    "user_id": "frontend_user"
+}).encode("utf-8")
+
+async def check_moderate_endpoint(session: aiohttp.ClientSession):
+    """Check /moderate endpoint; returns (passed, report)"""
     try:
-        response = requests.get(f"{BASE_URL}/moderate?page=1&limit=3")
-        if response.status_code == 200:
-            data = response.json()
-            print(f"✅ /moderate - SUCCESS: Got {len(data['data'])} items")
-            return True
-        else:
-            print(f"❌ /moderate - FAILED: Status {response.status_code}")
-            return False
+        async with session.get(f"{BASE_URL}/moderate?page=1&limit=3") as response:
+            if response.status == 200:
+                data = await response.json()
+                return True, f"✅ /moderate - SUCCESS: Got {len(data['data'])} items"
+            else:
+                return False, f"❌ /moderate - FAILED: Status {response.status}"
     except Exception as e:
-        print(f"❌ /moderate - ERROR: {e}")
-        return False
+        return False, f"❌ /moderate - ERROR: {e}"
 
-def test_feedback_endpoint():
-    """Test /feedback endpoint"""
-    print("Testing /feedback endpoint...")
+async def check_feedback_endpoint(session: aiohttp.ClientSession):
+    """Check /feedback endpoint; returns (passed, report)"""
     try:
-        payload = {
-            "userId": "test_user",
-            "thumbsUp": True,
-            "comment": "Great content moderation system"
-        }
-        response = requests.post(f"{BASE_URL}/feedback", json=payload)
-        if response.status_code == 200:
-            data = response.json()
-            print(f"✅ /feedback - SUCCESS: Feedback ID {data.get('feedbackId', 'N/A')}")
-            return True
-        else:
-            print(f"❌ /feedback - FAILED: Status {response.status_code}")
-            print(f"Response: {response.text}")
-            return False
+        async with session.post(f"{BASE_URL}/feedback", data=FEEDBACK_PAYLOAD, headers=JSON_HEADERS) as response:
+            if response.status == 200:
+                data = await response.json()
+                return True, f"✅ /feedback - SUCCESS: Feedback ID {data.get('feedbackId', 'N/A')}"
+            else:
+                return False, f"❌ /feedback - FAILED: Status {response.status}\nResponse: {await response.text()}"
     except Exception as e:
-        print(f"❌ /feedback - ERROR: {e}")
-        return False
+        return False, f"❌ /feedback - ERROR: {e}"
 
-def test_kb_analytics_endpoint():
-    """Test /kb-analytics endpoint"""
-    print("Testing /kb-analytics endpoint...")
+async def check_kb_analytics_endpoint(session: aiohttp.ClientSession):
+    """Check /kb-analytics endpoint; returns (passed, report)"""
     try:
-        response = requests.get(f"{BASE_URL}/kb-analytics?hours=24")
-        if response.status_code == 200:
-            data = response.json()
-            analytics = data.get('analytics', {})
-            print(f"✅ /kb-analytics - SUCCESS: {analytics.get('total_queries', 0)} total queries")
-            return True
-        else:
-            print(f"❌ /kb-analytics - FAILED: Status {response.status_code}")
-            return False
+        async with session.get(f"{BASE_URL}/kb-analytics?hours=24") as response:
+            if response.status == 200:
+                data = await response.json()
+                analytics = data.get('analytics', {})
+                return True, f"✅ /kb-analytics - SUCCESS: {analytics.get('total_queries', 0)} total queries"
+            else:
+                return False, f"❌ /kb-analytics - FAILED: Status {response.status}"
     except Exception as e:
-        print(f"❌ /kb-analytics - ERROR: {e}")
-        return False
+        return False, f"❌ /kb-analytics - ERROR: {e}"
 
-def test_query_kb_nlp_context():
-    """Test /query-kb endpoint for NLP context"""
-    print("Testing /query-kb endpoint for NLP context...")
+async def check_query_kb_nlp_context(session: aiohttp.ClientSession):
+    """Check /query-kb endpoint for NLP context; returns (passed, report)"""
     try:
-        payload = {
-            "query": "Analyze content with ID 123 for NLP context",
-            "limit": 3,
-            "user_id": "frontend_user"
-        }
-        response = requests.post(f"{BASE_URL}/query-kb", json=payload)
-        if response.status_code == 200:
-            data = response.json()
-            response_text = data.get('response', '')
-            print(f"✅ /query-kb (NLP) - SUCCESS: Response contains NLP analysis")
-            return True
-        else:
-            print(f"❌ /query-kb (NLP) - FAILED: Status {response.status_code}")
-            print(f"Response: {response.text}")
-            return False
+        async with session.post(f"{BASE_URL}/query-kb", data=QUERY_KB_NLP_PAYLOAD, headers=JSON_HEADERS) as response:
+            if response.status == 200:
+                data = await response.json()
+                response_text = data.get('response', '')
+                return True, f"✅ /query-kb (NLP) - SUCCESS: Response contains NLP analysis"
+            else:
+                return False, f"❌ /query-kb (NLP) - FAILED: Status {response.status}\nResponse: {await response.text()}"
     except Exception as e:
-        print(f"❌ /query-kb (NLP) - ERROR: {e}")
-        return False
+        return False, f"❌ /query-kb (NLP) - ERROR: {e}"
 
-def test_query_kb_tags():
-    """Test /query-kb endpoint for tags"""
-    print("Testing /query-kb endpoint for tags...")
+async def check_query_kb_tags(session: aiohttp.ClientSession):
+    """Check /query-kb endpoint for tags; returns (passed, report)"""
     try:
-        payload = {
-            "query": "Generate tags for content with ID 456",
-            "limit": 2,
-            "user_id": "frontend_user"
-        }
-        response = requests.post(f"{BASE_URL}/query-kb", json=payload)
-        if response.status_code == 200:
-            data = response.json()
-            response_text = data.get('response', '')
-            print(f"✅ /query-kb (Tags) - SUCCESS: Response contains tag generation")
-            return True
-        else:
-            print(f"❌ /query-kb (Tags) - FAILED: Status {response.status_code}")
-            print(f"Response: {response.text}")
-            return False
+        async with session.post(f"{BASE_URL}/query-kb", data=QUERY_KB_TAGS_PAYLOAD, headers=JSON_HEADERS) as response:
+            if response.status == 200:
+                data = await response.json()
+                response_text = data.get('response', '')
+                return True, f"✅ /query-kb (Tags) - SUCCESS: Response contains tag generation"
+            else:
+                return False, f"❌ /query-kb (Tags) - FAILED: Status {response.status}\nResponse: {await response.text()}"
     except Exception as e:
-        print(f"❌ /query-kb (Tags) - ERROR: {e}")
-        return False
+        return False, f"❌ /query-kb (Tags) - ERROR: {e}"
+
+# pytest entry points: thin wrappers that fail when the route check fails
+
+async def test_moderate_endpoint(session: aiohttp.ClientSession):
+    passed, report = await check_moderate_endpoint(session)
+    assert passed, report
+
+async def test_feedback_endpoint(session: aiohttp.ClientSession):
+    passed, report = await check_feedback_endpoint(session)
+    assert passed, report
 
-def main():
+async def test_kb_analytics_endpoint(session: aiohttp.ClientSession):
+    passed, report = await check_kb_analytics_endpoint(session)
+    assert passed, report
+
+async def test_query_kb_nlp_context(session: aiohttp.ClientSession):
+    passed, report = await check_query_kb_nlp_context(session)
+    assert passed, report
+
+async def test_query_kb_tags(session: aiohttp.ClientSession):
+    passed, report = await check_query_kb_tags(session)
+    assert passed, report
+
+async def main():
     print("="*60)
     print("TESTING ALL REQUIRED ROUTES")
     print("="*60)
     
     tests = [
-        ("/moderate (backend)", test_moderate_endpoint),
-        ("/feedback (Akash & Omkar)", test_feedback_endpoint),
-        ("/kb-analytics (Ashmit)", test_kb_analytics_endpoint),
-        ("/query-kb NLP context (Aditya)", test_query_kb_nlp_context),
-        ("/query-kb tags (Vijay)", test_query_kb_tags),
+        ("/moderate (backend)", check_moderate_endpoint),
+        ("/feedback (Akash & Omkar)", check_feedback_endpoint),
+        ("/kb-analytics (Ashmit)", check_kb_analytics_endpoint),
+        ("/query-kb NLP context (Aditya)", check_query_kb_nlp_context),
+        ("/query-kb tags (Vijay)", check_query_kb_tags),
     ]
     
+    async with make_session() as session:
+        # The routes are independent, so probe them all at once
+        outcomes = await asyncio.gather(
+            *(test_func(session) for _, test_func in tests),
+            return_exceptions=True,
+        )
+    
+    # Report each route under its own header once all probes are done
     results = []
-    for test_name, test_func in tests:
+    for (test_name, _), outcome in zip(tests, outcomes):
+        if isinstance(outcome, BaseException):
+            outcome = (False, f"❌ {test_name} - ERROR: {outcome}")
+        result, report = outcome
         print(f"\n{test_name}:")
-        result = test_func()
+        print(report)
         results.append((test_name, result))
     
     print("\n" + "="*60)
@@ -151,4 +167,4 @@ def main():
     return passed == total
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    asyncio.run(main())